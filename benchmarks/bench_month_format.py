@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Size and parse-time comparison of the month file formats.
+
+For every data/YYMM.json the benchmark encodes the compact format in memory
+(scripts/month_format.py), checks that decoding it gives back exactly the same
+records, and reports bytes on the wire (plain and gzip -9) plus the time to
+parse each variant.
+
+    python benchmarks/bench_month_format.py [--data-dir data] [--repeat 3]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from month_data import list_months
+from month_format import decode_month, dumps_compact, encode_records
+
+
+def _best(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    months = list_months(args.data_dir)
+    if not months:
+        print(f"No YYMM.json files in {args.data_dir}")
+        return
+
+    print(f"{'month':<6}{'json':>10}{'json.gz':>10}{'min':>10}{'min.gz':>10}{'parse json':>12}{'parse min':>12}")
+    totals = [0, 0, 0, 0, 0.0, 0.0]
+    for month in sorted(months):
+        plain = (Path(args.data_dir) / f"{month}.json").read_bytes()
+        records = json.loads(plain)
+        compact = dumps_compact(encode_records(records))
+        assert decode_month(json.loads(compact)) == records, f"{month}: compact round trip differs"
+
+        sizes = [len(plain), len(gzip.compress(plain, 9)), len(compact), len(gzip.compress(compact, 9))]
+        t_plain = _best(lambda: json.loads(plain), args.repeat)
+        t_compact = _best(lambda: decode_month(json.loads(compact)), args.repeat)
+        for i, value in enumerate(sizes + [t_plain, t_compact]):
+            totals[i] += value
+        print(f"{month:<6}" + "".join(f"{s / 1024:>8.0f}KB" for s in sizes)
+              + f"{t_plain * 1000:>10.1f}ms{t_compact * 1000:>10.1f}ms")
+
+    print("-" * 70)
+    print(f"{'total':<6}" + "".join(f"{s / 1024:>8.0f}KB" for s in totals[:4])
+          + f"{totals[4] * 1000:>10.1f}ms{totals[5] * 1000:>10.1f}ms")
+    print(f"\ncompact is {totals[0] / totals[2]:.1f}x smaller uncompressed, "
+          f"{totals[1] / totals[3]:.1f}x smaller gzipped, parses {totals[4] / totals[5]:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Timing benchmark for search2.build_search_index against the workbooks in data/.
+
+The workbooks are parsed once up front; the benchmark then times the old
+row-by-row (iterrows) index build against the columnar one and checks that
+both produce byte-identical search-index.json output.
+
+    python benchmarks/bench_search_index.py [--data-dir data] [--repeat 3]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import pandas as pd
+
+from normalization import size_key, strength_key
+from search2 import build_search_index, extract_packaging_type, get_natural_size
+
+
+def legacy_build_search_index(pv_frames, df_med):
+    """The pre-vectorization implementation, kept as the reference for timing and output."""
+    vnr_to_group_data = {}
+    group_metadata = {}
+    for df in pv_frames:
+        df = df.rename(columns={'Utbytesgrupp': 'Utbytesgrupps ID', 'Beredning': 'Beredningsform'})
+        for _, row in df.iterrows():
+            try:
+                raw_vnr = str(row['Varunummer']).strip()
+                if not raw_vnr or raw_vnr == 'nan': continue
+                vnr = str(int(float(raw_vnr)))
+                raw_gid = str(row['Utbytesgrupps ID']).strip()
+                if not raw_gid or raw_gid == 'nan': continue
+                gid = str(int(float(raw_gid)))
+                size_code = str(row['Förpackningsstorleksgrupp']).strip()
+                vnr_to_group_data[vnr] = {'gid': gid, 'size_code': size_code}
+                key = (gid, size_code)
+                if key not in group_metadata:
+                    group_metadata[key] = {
+                        'sub': str(row['Substans']).strip(),
+                        'form': str(row['Beredningsform']).strip()
+                    }
+            except: continue
+
+    final_data = {}
+    for _, row in df_med.iterrows():
+        try:
+            raw_vnr_field = str(row['Varunummer']).strip()
+            if not raw_vnr_field or raw_vnr_field == 'nan' or not any(c.isdigit() for c in raw_vnr_field):
+                continue
+            vnr = str(int(float(raw_vnr_field)))
+            if vnr in vnr_to_group_data:
+                mapping = vnr_to_group_data[vnr]
+                key = (mapping['gid'], mapping['size_code'])
+                if key not in final_data:
+                    final_data[key] = {
+                        'names': set(), 'vnr': set(), 'str': str(row['Styrka']).strip(),
+                        'packaging': set(), 'packaging_by_vnr': {}
+                    }
+                final_data[key]['names'].add(str(row['Produktnamn']).strip())
+                final_data[key]['vnr'].add(vnr)
+                packaging_type = extract_packaging_type(row.get('Förpackning'))
+                if packaging_type:
+                    final_data[key]['packaging'].add(packaging_type)
+                    final_data[key]['packaging_by_vnr'][vnr] = packaging_type
+        except:
+            continue
+
+    search_index = []
+    for (gid, size_code), data in final_data.items():
+        meta = group_metadata.get((gid, size_code))
+        if meta:
+            size = get_natural_size(size_code)
+            search_index.append({
+                "id": gid, "size_id": size_code, "sub": meta['sub'], "form": meta['form'],
+                "str": data['str'], "size": size,
+                "names": sorted(list(data['names'])), "vnr": sorted(list(data['vnr'])),
+                "packaging": sorted(list(data['packaging'])) if data.get('packaging') else [],
+                "packagingMap": data.get('packaging_by_vnr', {}),
+                # Sorteringsnycklarna räknade värde för värde, som compareSearchResults gjorde
+                "strKey": strength_key(data['str']), "sizeKey": size_key(size),
+            })
+    search_index.sort(key=lambda x: x['sub'])
+    return search_index
+
+
+def _best_of(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark search-index build: iterrows vs columnar")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pv_files = sorted(
+        (f for f in glob.glob(os.path.join(args.data_dir, "*.xlsx")) if not os.path.basename(f).startswith("~$")),
+        key=os.path.basename, reverse=True,
+    )
+    pv_files = [f for f in pv_files if "2403" not in os.path.basename(f)]
+
+    t0 = time.perf_counter()
+    pv_frames = [pd.read_excel(f) for f in pv_files]
+    df_med = pd.read_excel(os.path.join(args.data_dir, "MEDPrice.xlsx"))
+    parse_time = time.perf_counter() - t0
+    rows = sum(len(df) for df in pv_frames) + len(df_med)
+
+    legacy_time, legacy = _best_of(lambda: legacy_build_search_index(pv_frames, df_med), args.repeat)
+    columnar_time, columnar = _best_of(lambda: build_search_index(pv_frames, df_med), args.repeat)
+
+    legacy_bytes = json.dumps(legacy, ensure_ascii=False, indent=2).encode("utf-8")
+    columnar_bytes = json.dumps(columnar, ensure_ascii=False, indent=2).encode("utf-8")
+    identical = legacy_bytes == columnar_bytes
+
+    print(f"Workbooks:        {len(pv_files)} ({rows} rows)")
+    print(f"Parse (openpyxl): {parse_time:8.2f} s")
+    print(f"Build, iterrows:  {legacy_time:8.3f} s")
+    print(f"Build, columnar:  {columnar_time:8.3f} s  ({legacy_time / columnar_time:.1f}x)")
+    print(f"Output identical: {identical} ({len(columnar)} entries)")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
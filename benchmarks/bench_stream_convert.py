@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Peak-RSS benchmark: DataFrame conversion vs streaming conversion.
+
+Each conversion runs in a fresh subprocess so the reported peak resident set
+size (ru_maxrss) belongs to that path alone. The DataFrame path is the
+uncached pd.read_excel + to_json conversion; the streaming path is
+pipeline.convert.stream_xlsx_to_json. Both write to a temporary directory and
+the JSON outputs are checked for byte equality.
+
+    python benchmarks/bench_stream_convert.py [data/2602.xlsx data/MEDPrice.xlsx ...]
+"""
+
+import argparse
+import filecmp
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def _child(mode, xlsx, out):
+    sys.path.insert(0, str(SCRIPTS))
+    from pipeline.convert import stream_xlsx_to_json
+    from workbooks import parse_workbook
+
+    start = time.perf_counter()
+    if mode == "dataframe":
+        df = parse_workbook(xlsx)
+        df.to_json(out, orient="records", indent=4, force_ascii=False)
+        rows = len(df)
+    else:
+        rows = stream_xlsx_to_json(xlsx, out, formats=("records",))
+    elapsed = time.perf_counter() - start
+    # ru_maxrss är i KB på Linux
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"rows": rows, "seconds": elapsed, "peak_mb": peak_mb}))
+
+
+def _run(mode, xlsx, out):
+    result = subprocess.run(
+        [sys.executable, __file__, "--child", mode, str(xlsx), str(out)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peak RSS of DataFrame vs streaming XLSX conversion")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--data-dir", default="data")
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child(*args.child)
+        return
+
+    files = [Path(f) for f in args.files]
+    if not files:
+        months = sorted(p for p in Path(args.data_dir).glob("*.xlsx") if p.stem.isdigit())
+        files = months[-1:] + [p for p in [Path(args.data_dir) / "MEDPrice.xlsx"] if p.exists()]
+
+    print(f"{'file':<16}{'mode':<11}{'rows':>8}{'time':>9}{'peak RSS':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for xlsx in files:
+            outputs = {}
+            for mode in ("dataframe", "streaming"):
+                out = Path(tmp) / f"{xlsx.stem}.{mode}.json"
+                r = _run(mode, xlsx, out)
+                outputs[mode] = out
+                print(f"{xlsx.name:<16}{mode:<11}{r['rows']:>8}{r['seconds']:>8.1f}s{r['peak_mb']:>8.0f} MB")
+            same = filecmp.cmp(outputs["dataframe"], outputs["streaming"], shallow=False)
+            print(f"{'':<16}identical output: {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Python replicas of the lookups script.js does in the browser, for benchmarking.
+
+- group_stats_from_months: getPriceStatistics() without history shards, i.e.
+  fetch the N newest YYMM.json files and filter each for the group
+- group_stats_from_history: the same with one data/history shard per group,
+  using its precomputed "stats" when present
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from group_stats import STATS_WINDOW, client_stats, price_stats
+from month_data import group_key, item_status, key_str, list_months, load_month
+
+
+def group_stats_from_months(data_dir: Path, entry: Dict[str, Any], months: int = STATS_WINDOW) -> Optional[Dict[str, Any]]:
+    key = (key_str(entry["id"]), key_str(entry["size_id"]))
+    prices = []
+    for month in list_months(data_dir)[:months]:
+        rows = [i for i in load_month(data_dir, month) if group_key(i) == key]
+        pv = next((i for i in rows if item_status(i) == "PV"), None)
+        if pv is not None:
+            prices.append(pv["Försäljningspris"])
+    return client_stats(price_stats(prices))
+
+
+def group_stats_from_history(data_dir: Path, entry: Dict[str, Any], months: int = STATS_WINDOW) -> Optional[Dict[str, Any]]:
+    path = Path(data_dir) / "history" / f"{entry['id']}-{entry['size_id']}.json"
+    if not path.exists():
+        return None
+    shard = json.loads(path.read_text(encoding="utf-8"))
+    newest = list_months(data_dir)[0]
+    if newest in shard.get("stats", {}):
+        return client_stats(shard["stats"][newest])
+    prices = []
+    for month in list_months(data_dir)[:months]:
+        summary = shard["months"].get(month)
+        if summary and summary["pv"] is not None:
+            prices.append(summary["pv"])
+    return client_stats(price_stats(prices))
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the data pipeline.
+
+Uses the checked-in data/*.xlsx and MEDPrice.xlsx as fixtures: they are copied
+to benchmarks/.fixture/ (not committed) and converted once, so every case runs
+against the same month files. Each case runs in its own subprocess and reports
+
+- seconds: median wall time over --repeat runs (plus the fastest run)
+- peak_alloc_mb: peak Python allocations (tracemalloc) during one extra run
+- max_rss_mb: peak resident set size of the subprocess
+
+Results are written as JSON (--output) and compared with the stored baseline
+(benchmarks/baseline.json); a case that is slower or uses more memory than
+the baseline by more than the tolerance is reported as a regression and the
+script exits with status 1.
+
+    python benchmarks/run_benchmarks.py                     # run all, compare
+    python benchmarks/run_benchmarks.py --cases search_index,verify_data
+    python benchmarks/run_benchmarks.py --update-baseline   # store new baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+FIXTURE = Path(__file__).resolve().parent / ".fixture"
+
+SEARCH_TERMS = ["ab", "ome", "omeprazol", "omeprazol 20", "ibuprofen 400 mg", "metf", "paracetamol 500", "levo"]
+GROUP_SAMPLE = 5
+# Hjälpfunktioner som ska gå att importera utan pandas, numpy, requests och bs4
+HELPER_IMPORTS = (
+    "from search2 import extract_packaging_type, get_natural_size; "
+    "from pipeline.fetch import extract_month_code; "
+    "from verify_data import validate_item; "
+    "import update_tlv_data"
+)
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "openpyxl", "requests", "bs4")
+# Tidsskillnader under detta är brus för millisekundsfallen
+MIN_TIME_DELTA = 0.01
+
+
+def prepare_fixture(source_dir=ROOT / "data", fixture=FIXTURE):
+    """Copy the workbooks to the fixture directory and convert them (incrementally)."""
+    from pipeline import run_pipeline
+
+    data = fixture / "data"
+    data.mkdir(parents=True, exist_ok=True)
+    for xlsx in Path(source_dir).glob("*.xlsx"):
+        target = data / xlsx.name
+        if not target.exists() or target.stat().st_size != xlsx.stat().st_size:
+            shutil.copy2(xlsx, target)
+    # Återanvänd redan tolkade arbetsböcker om de finns
+    cached = Path(source_dir) / ".cache" / "workbooks"
+    if cached.exists():
+        shutil.copytree(cached, data / ".cache" / "workbooks", dirs_exist_ok=True)
+    run_pipeline(stages=("convert", "history", "store", "search"), data_dir=data, tmp_dir=fixture / "tmp", offline=True)
+    return data
+
+
+def _reset_stage(data, stage):
+    """Forget a stage's incremental state so the case measures a full build."""
+    from build_manifest import BuildManifest
+
+    shutil.rmtree(data / ".cache" / stage, ignore_errors=True)
+    manifest = BuildManifest(data)
+    manifest.data["stages"].pop(stage, None)
+    manifest.save()
+
+
+# --- Cases: each returns (setup, run); setup runs before every timed run ---
+
+def case_convert(data):
+    """convert_xlsx_to_json on the newest month, workbook not in the Parquet cache."""
+    from pipeline.convert import convert_xlsx_to_json
+
+    newest = sorted(p for p in data.glob("*.xlsx") if p.stem.isdigit())[-1]
+    work = data.parent / "convert"
+
+    def setup():
+        shutil.rmtree(work, ignore_errors=True)
+        work.mkdir()
+        shutil.copy2(newest, work / newest.name)
+
+    return setup, lambda: convert_xlsx_to_json(work / newest.name, work / f"{newest.stem}.json")
+
+
+def case_substances(data):
+    """getsubstances.build_substances from the (already built) price store."""
+    from getsubstances import build_substances
+
+    return None, lambda: build_substances(str(data))
+
+
+def case_search_index(data):
+    """search2.create_global_search_index, per-workbook cache cleared (workbooks already parsed)."""
+    from search2 import create_global_search_index
+
+    def setup():
+        _reset_stage(data, "search-index")
+        _reset_stage(data, "search-index-med")
+
+    return setup, lambda: create_global_search_index(str(data))
+
+
+def case_verify_data(data):
+    """verify_data.validate_file with --limit 0 over every month."""
+    from month_data import list_months
+    from verify_data import validate_file
+
+    files = [data / f"{m}.json" for m in list_months(data)]
+    return None, lambda: [validate_file(p, None) for p in files]
+
+
+def case_import_helpers(data):
+    """Cold start of a fresh interpreter that imports the lightweight helpers (CLI startup)."""
+    command = [sys.executable, "-c", HELPER_IMPORTS]
+    return None, lambda: subprocess.run(command, cwd=ROOT / "scripts", check=True)
+
+
+def _search_index(data):
+    with open(data / "search-index.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sample_groups(data):
+    index = _search_index(data)
+    return index[:: max(1, len(index) // GROUP_SAMPLE)][:GROUP_SAMPLE]
+
+
+def case_client_search_scan(data):
+    """Search box, linear filter + sort over search-index.json (the pre-lookup client)."""
+    from search_lookup import scan_search
+
+    index = _search_index(data)
+    return None, lambda: [scan_search(index, t)[:20] for t in SEARCH_TERMS]
+
+
+def case_client_search_lookup(data):
+    """Search box with search-lookup.json."""
+    from search_lookup import query
+
+    with open(data / "search-lookup.json", encoding="utf-8") as f:
+        lookup = json.load(f)
+    return None, lambda: [query(lookup, t) for t in SEARCH_TERMS]
+
+
+def case_client_group_months(data):
+    """12-month PV statistics for sample groups, reading the YYMM.json files."""
+    from client_paths import group_stats_from_months
+
+    entries = _sample_groups(data)
+    return None, lambda: [group_stats_from_months(data, e) for e in entries]
+
+
+def case_client_group_history(data):
+    """12-month PV statistics for sample groups, reading the history shards."""
+    from client_paths import group_stats_from_history
+
+    entries = _sample_groups(data)
+    return None, lambda: [group_stats_from_history(data, e) for e in entries]
+
+
+CASES = {
+    "convert_xlsx_to_json": case_convert,
+    "build_substances": case_substances,
+    "search_index": case_search_index,
+    "verify_data": case_verify_data,
+    "import_helpers": case_import_helpers,
+    "client_search_scan": case_client_search_scan,
+    "client_search_lookup": case_client_search_lookup,
+    "client_group_months": case_client_group_months,
+    "client_group_history": case_client_group_history,
+}
+
+
+def run_case(name, data, repeat):
+    setup, run = CASES[name](Path(data))
+    times = []
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            for _ in range(repeat):
+                if setup:
+                    setup()
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+            if setup:
+                setup()
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            sys.stdout = stdout
+    return {
+        "seconds": statistics.median(times),
+        "min_seconds": min(times),
+        "repeat": repeat,
+        "peak_alloc_mb": peak / 1024 / 1024,
+        "max_rss_mb": _max_rss_mb(),
+    }
+
+
+def _max_rss_mb():
+    """Peak RSS of this process. On Linux ru_maxrss survives exec (it would include the parent), VmHWM does not."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss är i KB på Linux, i byte på macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def compare(results, baseline, time_tolerance, memory_tolerance):
+    """Names and messages of cases that regressed against the baseline."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        for metric, tolerance in (("seconds", time_tolerance), ("peak_alloc_mb", memory_tolerance)):
+            limit = base[metric] * (1 + tolerance)
+            if metric == "seconds":
+                limit = max(limit, base[metric] + MIN_TIME_DELTA)
+            if result[metric] > limit:
+                regressions.append(f"{name}: {metric} {result[metric]:.3f} > {base[metric]:.3f} (+{tolerance:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time and memory-profile the data pipeline.")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=str(ROOT / "data"), help="Where the fixture workbooks come from")
+    parser.add_argument("--output", default=str(FIXTURE / "results.json"))
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--time-tolerance", type=float, default=0.30)
+    parser.add_argument("--memory-tolerance", type=float, default=0.20)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--child", nargs=2, metavar=("CASE", "DATA"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_case(args.child[0], args.child[1], args.repeat)))
+        return 0
+
+    names = [n.strip() for n in args.cases.split(",") if n.strip()]
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    print("Preparing fixture...")
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            data = prepare_fixture(args.data_dir)
+        finally:
+            sys.stdout = stdout
+
+    results = {}
+    print(f"{'case':<24}{'median':>10}{'min':>10}{'peak alloc':>12}{'max RSS':>10}")
+    for name in names:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", name, str(data), "--repeat", str(args.repeat)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{name:<24}FAILED\n{proc.stderr.strip()}")
+            return 2
+        r = results[name] = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{name:<24}{r['seconds']:>9.3f}s{r['min_seconds']:>9.3f}s{r['peak_alloc_mb']:>9.1f} MB{r['max_rss_mb']:>7.0f} MB")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "cases": results,
+    }
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults: {args.output}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        stored = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {"cases": {}}
+        stored.update({k: v for k, v in report.items() if k != "cases"})
+        stored["cases"].update(results)
+        baseline_path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print("No baseline stored; run with --update-baseline to create one.")
+        return 0
+
+    regressions = compare(results, json.loads(baseline_path.read_text(encoding="utf-8")),
+                          args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\n⚠️  Regressions against baseline:")
+        for line in regressions:
+            print(f"   - {line}")
+        return 1
+    print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())